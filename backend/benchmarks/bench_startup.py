@@ -0,0 +1,164 @@
+"""Cold-start benchmark for the backend.
+
+Each run uses a fresh interpreter so module caches are cold, and reports
+four separate timings:
+
+- import: ``import main``, after fastapi/pydantic/httpx are already
+  loaded, so only the app's own import cost is counted
+- startup: running the app lifespan once (creating the shared services)
+- request: the first ``GET /`` sent through the ASGI app inside that
+  lifespan (routing, middleware, threadpool and serialization included)
+- analyze: the first ``POST /api/analyze`` on a three-package fixture
+  repo with registry lookups stubbed, so imports deferred until the
+  first analysis (packaging) are measured rather than just moved
+
+The median over several runs is checked against the budgets below, and the
+script exits non-zero if one is exceeded or if requests/packaging get
+loaded by ``import main``.
+
+Measured medians (Python 3.11.7, fastapi 0.143.1, 11 runs, three rounds):
+
+    baseline (eager imports)   import 80-101 ms  startup 0.0 ms  GET / 14-18 ms  analyze 1.8-2.3 ms
+                               requests + packaging loaded at import
+    lazy modules + services    import 44-58 ms   startup 0.1 ms  GET / 15-19 ms  analyze 4.3-6.1 ms
+                               neither loaded
+
+Deferring packaging adds about 3 ms to the first analysis and saves about
+40 ms on import. The import budget sits between the two rows so that going
+back to eager imports fails; the other budgets allow about 2x headroom.
+
+Usage (from backend/):
+    python benchmarks/bench_startup.py [--runs N] [--backend-dir PATH]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Budgets in milliseconds
+IMPORT_BUDGET_MS = 70
+STARTUP_BUDGET_MS = 2
+REQUEST_BUDGET_MS = 40
+ANALYZE_BUDGET_MS = 12
+
+# Modules that must not be loaded just to import the app and answer "/"
+HEAVY_MODULES = ["requests", "packaging"]
+
+PROBE = """
+import asyncio, json, shutil, sys, tempfile, time
+from pathlib import Path
+
+# Framework imports are the same before and after any change to this app,
+# so load them up front and time only what main.py itself pulls in
+import fastapi, fastapi.middleware.cors, fastapi.responses, pydantic
+import httpx
+
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+loaded = [m for m in %r if m in sys.modules]
+
+# Stub registry lookups so the first analysis measures our own cost
+# (including deferred imports), not the network
+import modules.dependency_analyzer as dependency_analyzer
+REGISTRY = {
+    "https://pypi.org/pypi/requests/json": {"info": {"version": "2.32.3"}},
+    "https://pypi.org/pypi/flask/json": {"info": {"version": "2.3.3"}},
+    "https://registry.npmjs.org/react": {"dist-tags": {"latest": "18.3.1"}},
+}
+dependency_analyzer.fetch_json = lambda url, timeout=5: REGISTRY.get(url)
+
+repo = Path(tempfile.mkdtemp())
+(repo / "requirements.txt").write_text("requests==2.25.0\\nflask==2.3.1\\n")
+(repo / "package.json").write_text('{"dependencies": {"react": "^17.0.2"}}')
+
+async def cold_start():
+    timings = {}
+    t2 = time.perf_counter()
+    async with main.app.router.lifespan_context(main.app):
+        t3 = time.perf_counter()
+        timings["startup_ms"] = (t3 - t2) * 1000
+
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            t4 = time.perf_counter()
+            response = await client.get("/")
+            t5 = time.perf_counter()
+            response.raise_for_status()
+
+            response = await client.post("/api/analyze", json={"local_path": str(repo)})
+            t6 = time.perf_counter()
+            response.raise_for_status()
+            assert response.json()["analysis_report"]["total_packages"] == 3
+
+    timings["request_ms"] = (t5 - t4) * 1000
+    timings["analyze_ms"] = (t6 - t5) * 1000
+    return timings
+
+timings = asyncio.run(cold_start())
+shutil.rmtree(repo)
+
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    **timings,
+    "loaded": loaded,
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run_probe(backend_dir: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--backend-dir", type=Path, default=BACKEND_DIR)
+    args = parser.parse_args()
+
+    runs = [run_probe(args.backend_dir) for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    startup_ms = statistics.median(r["startup_ms"] for r in runs)
+    request_ms = statistics.median(r["request_ms"] for r in runs)
+    analyze_ms = statistics.median(r["analyze_ms"] for r in runs)
+    loaded = sorted({m for r in runs for m in r["loaded"]})
+    failures = []
+
+    print(f"median of {args.runs} runs")
+    print(f"import main:        {import_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"startup (lifespan): {startup_ms:.1f} ms (budget {STARTUP_BUDGET_MS} ms)")
+    print(f"first GET /:        {request_ms:.1f} ms (budget {REQUEST_BUDGET_MS} ms)")
+    print(f"first analyze:      {analyze_ms:.1f} ms (budget {ANALYZE_BUDGET_MS} ms)")
+    print(f"heavy modules:      {', '.join(loaded) or 'none'}")
+
+    if import_ms > IMPORT_BUDGET_MS:
+        failures.append("import time over budget")
+    if startup_ms > STARTUP_BUDGET_MS:
+        failures.append("startup over budget")
+    if request_ms > REQUEST_BUDGET_MS:
+        failures.append("first request over budget")
+    if analyze_ms > ANALYZE_BUDGET_MS:
+        failures.append("first analyze over budget")
+    if loaded:
+        failures.append(f"heavy modules loaded by import main: {loaded}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
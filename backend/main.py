@@ -1,10 +1,49 @@
-from fastapi import FastAPI, HTTPException
+import threading
+from contextlib import asynccontextmanager
+from itertools import chain
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from modules.repo_fetcher import RepoFetcher
 from modules.dependency_analyzer import DependencyAnalyzer
+from modules.report_builder import ReportBuilder
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI(title="DeadRepo Doctor API")
+
+# ✅ Application-scoped services, created once and shared by all requests
+_services_lock = threading.Lock()
+
+
+def _service(app: FastAPI, name: str, factory):
+    service = getattr(app.state, name, None)
+    if service is None:
+        with _services_lock:
+            service = getattr(app.state, name, None)
+            if service is None:
+                service = factory()
+                setattr(app.state, name, service)
+    return service
+
+
+def get_fetcher(request: Request) -> RepoFetcher:
+    return _service(request.app, "fetcher", RepoFetcher)
+
+
+def get_analyzer(request: Request) -> DependencyAnalyzer:
+    return _service(request.app, "analyzer", DependencyAnalyzer)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up at startup; get_* still create them on first use if skipped
+    _service(app, "fetcher", RepoFetcher)
+    _service(app, "analyzer", DependencyAnalyzer)
+    yield
+
+
+app = FastAPI(title="DeadRepo Doctor API", lifespan=lifespan)
 
 # ✅ FIXED CORS (ALLOWS ALL ORIGINS — NO MORE FAILED TO FETCH)
 app.add_middleware(
@@ -26,15 +65,41 @@ class AnalyzeRequest(BaseModel):
     local_path: str
 
 
+
+# ------------------------------
+# Helpers
+# ------------------------------
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Return True if the Accept-Encoding header allows a gzip response."""
+    qvalues = {}
+    for item in (accept_encoding or "").split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.lower()] = q
+
+    # An explicit gzip entry takes precedence over the "*" wildcard
+    q = qvalues.get("gzip", qvalues.get("*", 0.0))
+    return q > 0
+
+
 # ------------------------------
 # API ROUTES
 # ------------------------------
 
 # ✅ Fetch / Clone Repo Endpoint
 @app.post("/api/fetch")
-def fetch_repo(request: FetchRequest):
+def fetch_repo(request: FetchRequest, fetcher: RepoFetcher = Depends(get_fetcher)):
     try:
-        fetcher = RepoFetcher()
         local_path = fetcher.fetch_repo(request.repo_url)
 
         return {"local_path": local_path}
@@ -45,9 +110,8 @@ def fetch_repo(request: FetchRequest):
 
 # ✅ Analyze Repo Endpoint
 @app.post("/api/analyze")
-def analyze_repo(request: AnalyzeRequest):
+def analyze_repo(request: AnalyzeRequest, analyzer: DependencyAnalyzer = Depends(get_analyzer)):
     try:
-        analyzer = DependencyAnalyzer()
         report = analyzer.analyze(request.local_path)
 
         flat = {
@@ -64,6 +128,35 @@ def analyze_repo(request: AnalyzeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ✅ Streaming Analyze Endpoint (NDJSON, one package per line + summary line)
+@app.post("/api/analyze/stream")
+def analyze_repo_stream(
+    request: AnalyzeRequest,
+    analyzer: DependencyAnalyzer = Depends(get_analyzer),
+    accept_encoding: Optional[str] = Header(None),
+):
+    try:
+        # Run the scan and first lookup before headers go out, so early
+        # failures still surface as a 500 like /api/analyze
+        records = analyzer.iter_analyze(request.local_path)
+        first = next(records)
+        if first["type"] == "error":
+            raise Exception(f"Failed to check {first['name']}: {first['detail']}")
+        records = chain([first], records)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    body = ReportBuilder.stream_ndjson(records)
+    headers = {"Vary": "Accept-Encoding"}
+
+    if accepts_gzip(accept_encoding):
+        body = ReportBuilder.stream_gzip(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
+
+
 # ------------------------------
 # Root Endpoint (Optional)
 # ------------------------------
@@ -1,21 +1,32 @@
-"""Repo fetcher modules."""
-
-from .url_validator import URLValidator
-from .repo_cloner import RepoCloner
-from .storage_manager import StorageManager
-from .repo_fetcher import RepoFetcher
-from .dependency_scanner import DependencyScanner
-from .version_checker import VersionChecker
-from .report_builder import ReportBuilder
-from .dependency_analyzer import DependencyAnalyzer
-
-__all__ = [
-    "URLValidator",
-    "RepoCloner", 
-    "StorageManager",
-    "RepoFetcher",
-    "DependencyScanner",
-    "VersionChecker",
-    "ReportBuilder",
-    "DependencyAnalyzer"
-]
+"""Repo fetcher modules.
+
+Submodules are imported on first attribute access so that importing the
+package (e.g. for a health check) does not pull in requests/packaging.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "URLValidator": ".url_validator",
+    "RepoCloner": ".repo_cloner",
+    "StorageManager": ".storage_manager",
+    "RepoFetcher": ".repo_fetcher",
+    "DependencyScanner": ".dependency_scanner",
+    "VersionChecker": ".version_checker",
+    "ReportBuilder": ".report_builder",
+    "DependencyAnalyzer": ".dependency_analyzer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,7 @@
 import time
 import json
 from urllib import request, parse
-from packaging import version as pkg_version
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from pathlib import Path
 
 from .dependency_scanner import DependencyScanner
@@ -29,11 +28,18 @@ def clean_version(v):
     return v
 
 
+def _parse_version(v):
+    # packaging is imported on first use so importing this module (and the
+    # app) stays cheap at startup
+    from packaging import version as pkg_version
+    return pkg_version.parse(v)
+
+
 def compare(cur, lat):
     if not cur or not lat:
         return None
-    cur_v = pkg_version.parse(cur)
-    lat_v = pkg_version.parse(lat)
+    cur_v = _parse_version(cur)
+    lat_v = _parse_version(lat)
     if cur_v == lat_v:
         return "up-to-date"
     if lat_v.release[0] > cur_v.release[0]:
@@ -45,6 +51,9 @@ def compare(cur, lat):
     return "unknown"
 
 
+SEVERITY_PENALTY = {"major": 8, "minor": 3, "patch": 1}
+
+
 class DependencyAnalyzer:
     def __init__(self, timeout_seconds=30):
         self.timeout_seconds = timeout_seconds
@@ -56,7 +65,7 @@ class DependencyAnalyzer:
         if "dist-tags" in data and "latest" in data["dist-tags"]:
             return clean_version(data["dist-tags"]["latest"])
         versions = list(data.get("versions", {}).keys())
-        versions.sort(key=lambda x: pkg_version.parse(clean_version(x)))
+        versions.sort(key=lambda x: _parse_version(clean_version(x)))
         return clean_version(versions[-1]) if versions else None
 
     def _pypi_latest(self, pkg):
@@ -75,74 +84,112 @@ class DependencyAnalyzer:
         except:
             return None
 
-    def analyze(self, repo_path: str):
+    def _collect_packages(self, repo_path: str) -> Dict[str, Dict]:
         scanner = DependencyScanner(repo_path)
         scan = scanner.scan()
 
-        deps = scan["dependencies"]
-        files_found = scan["files_found"]
-
         all_packages = {}
-        for d in deps:
+        for d in scan["dependencies"]:
             name = d["name"]
             eco = d["ecosystem"]
-            cur = clean_version(d["version"])
             key = f"{eco}:{name}"
             all_packages[key] = {
                 "name": name,
                 "ecosystem": eco,
-                "current_version": cur,
-                "latest_version": None,
-                "severity": None
+                "current_version": clean_version(d["version"])
             }
+        return all_packages
+
+    def _latest_version(self, eco: str, name: str) -> Optional[str]:
+        if eco == "npm":
+            return self._npm_latest(name)
+        if eco == "pypi":
+            return self._pypi_latest(name)
+        if eco == "composer":
+            return self._composer_latest(name)
+        return None
 
-        outdated = []
-        start = time.time()
-
-        for meta in all_packages.values():
-            if time.time() - start > self.timeout_seconds:
+    def iter_analyze(self, repo_path: str) -> Iterator[Dict]:
+        """
+        Analyze a repository incrementally.
+
+        Yields one ``{"type": "package", ...}`` record per checked package as
+        soon as its registry lookup finishes, followed by a single
+        ``{"type": "summary", ...}`` record. The scanned dependency list is
+        held in memory, but checked results are handed to the caller and not
+        retained. If a lookup fails, a final ``{"type": "error", ...}``
+        record is yielded in place of the summary.
+        """
+        all_packages = self._collect_packages(repo_path)
+
+        outdated_count = 0
+        penalty = 0
+        # Only lookup time counts toward the timeout, not time spent
+        # suspended at yield while a streaming client reads
+        elapsed = 0.0
+
+        for dep in all_packages.values():
+            if elapsed > self.timeout_seconds:
                 partial = True
                 break
 
-            eco = meta["ecosystem"]
-            name = meta["name"]
-
-            if eco == "npm":
-                latest = self._npm_latest(name)
-            elif eco == "pypi":
-                latest = self._pypi_latest(name)
-            elif eco == "composer":
-                latest = self._composer_latest(name)
-            else:
-                latest = None
-
-            meta["latest_version"] = latest
-            meta["severity"] = compare(meta["current_version"], latest)
-
-            if meta["severity"] not in (None, "up-to-date"):
-                outdated.append(meta)
+            start = time.time()
+            try:
+                latest = self._latest_version(dep["ecosystem"], dep["name"])
+                severity = compare(dep["current_version"], latest)
+            except Exception as e:
+                yield {
+                    "type": "error",
+                    "name": dep["name"],
+                    "ecosystem": dep["ecosystem"],
+                    "detail": f"{type(e).__name__}: {e}"
+                }
+                return
+            elapsed += time.time() - start
+
+            if severity not in (None, "up-to-date"):
+                outdated_count += 1
+                penalty += SEVERITY_PENALTY.get(severity, 0)
+
+            yield {
+                "type": "package",
+                **dep,
+                "latest_version": latest,
+                "severity": severity
+            }
         else:
             partial = False
 
-        total = len(all_packages)
-        outdated_count = len(outdated)
-
         # HEALTH SCORE
-        score = 100
-        for d in outdated:
-            if d["severity"] == "major": score -= 8
-            if d["severity"] == "minor": score -= 3
-            if d["severity"] == "patch": score -= 1
-
-        score -= outdated_count
+        score = 100 - penalty - outdated_count
         score = max(0, min(100, score))
 
-        return {
+        yield {
+            "type": "summary",
             "summary": {
-                "total_packages": total,
+                "total_packages": len(all_packages),
                 "outdated_count": outdated_count
             },
             "health_score": score,
-            "outdated_packages": outdated,
             "partial": partial
         }
+
+    def analyze(self, repo_path: str):
+        outdated = []
+        result = {}
+
+        for record in self.iter_analyze(repo_path):
+            kind = record.pop("type")
+            if kind == "error":
+                raise Exception(f"Failed to check {record['name']}: {record['detail']}")
+            if kind == "summary":
+                result = record
+            elif record["severity"] not in (None, "up-to-date"):
+                outdated.append(record)
+
+        return {
+            "summary": result["summary"],
+            "health_score": result["health_score"],
+            "outdated_packages": outdated,
+            "partial": result["partial"]
+        }
@@ -1,12 +1,19 @@
 """Report builder for dependency analysis results."""
 
-from typing import Dict, List
+import json
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List
 from datetime import datetime
 
 
 class ReportBuilder:
     """Builds structured reports from dependency analysis data."""
     
+    GZIP_LEVEL = 6
+    GZIP_FLUSH_BYTES = 64 * 1024
+    GZIP_FLUSH_SECONDS = 1.0
+    
     @staticmethod
     def build_report(scan_results: Dict, version_check_results: List[Dict]) -> Dict:
         """
@@ -91,3 +98,60 @@ class ReportBuilder:
             return f"All {total} dependencies are up to date! Health score: {health_score}/100"
         
         return f"Found {outdated} outdated package(s) out of {total} total. Health score: {health_score}/100"
+    
+    @staticmethod
+    def stream_ndjson(records: Iterable[Dict]) -> Iterator[bytes]:
+        """
+        Encode report records as newline-delimited JSON.
+        
+        Args:
+            records: Iterable of report records, e.g. DependencyAnalyzer.iter_analyze()
+            
+        Yields:
+            One UTF-8 encoded JSON line per record
+        """
+        for record in records:
+            yield (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    
+    @staticmethod
+    def stream_gzip(
+        chunks: Iterable[bytes],
+        level: int = GZIP_LEVEL,
+        flush_bytes: int = GZIP_FLUSH_BYTES,
+        flush_seconds: float = GZIP_FLUSH_SECONDS
+    ) -> Iterator[bytes]:
+        """
+        Gzip-compress a byte stream incrementally.
+        
+        Input is fed to a single deflate stream and sync-flushed only once
+        flush_bytes of input or flush_seconds have built up since the last
+        flush. Flushing every small record would defeat compression.
+        
+        Args:
+            chunks: Iterable of byte chunks, e.g. from stream_ndjson()
+            level: Compression level (1-9)
+            flush_bytes: Input bytes to accumulate before a sync flush
+            flush_seconds: Maximum time between sync flushes while input arrives
+            
+        Yields:
+            Compressed chunks forming a single gzip member; everything up to
+            each sync flush can be decoded by the client on arrival
+        """
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        pending = []
+        pending_bytes = 0
+        last_flush = time.monotonic()
+        
+        for chunk in chunks:
+            pending.append(compressor.compress(chunk))
+            pending_bytes += len(chunk)
+            
+            if pending_bytes >= flush_bytes or time.monotonic() - last_flush >= flush_seconds:
+                pending.append(compressor.flush(zlib.Z_SYNC_FLUSH))
+                yield b"".join(pending)
+                pending = []
+                pending_bytes = 0
+                last_flush = time.monotonic()
+        
+        pending.append(compressor.flush())
+        yield b"".join(pending)
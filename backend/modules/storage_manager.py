@@ -28,6 +28,9 @@ class StorageManager:
         Returns:
             Absolute path to the created directory
         """
+        # The manager is long-lived, so re-create the base directory in
+        # case a tmp cleaner removed it since startup
+        self.repos_dir.mkdir(parents=True, exist_ok=True)
         temp_dir = tempfile.mkdtemp(dir=self.repos_dir)
         return temp_dir
     
@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from modules import dependency_analyzer  # noqa: E402
+
+REGISTRY = {
+    "https://pypi.org/pypi/requests/json": {"info": {"version": "2.32.3"}},
+    "https://pypi.org/pypi/flask/json": {"info": {"version": "2.3.3"}},
+    "https://pypi.org/pypi/numpy/json": {"info": {"version": "1.26.4"}},
+    "https://registry.npmjs.org/react": {"dist-tags": {"latest": "18.3.1"}},
+    "https://registry.npmjs.org/lodash": {"dist-tags": {"latest": "4.17.21"}},
+    "https://registry.npmjs.org/vite": None,
+}
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Stub registry lookups; tests may add or override entries."""
+    data = dict(REGISTRY)
+    monkeypatch.setattr(dependency_analyzer, "fetch_json", lambda url, timeout=5: data[url])
+    return data
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "requirements.txt").write_text(
+        "requests==2.25.0\nflask==2.3.1\n# comment\nnumpy==1.26.4\n"
+    )
+    (tmp_path / "package.json").write_text(
+        '{"dependencies": {"react": "^17.0.2", "lodash": "4.17.21"},'
+        ' "devDependencies": {"vite": "~5.0.0"}}'
+    )
+    return tmp_path
@@ -0,0 +1,69 @@
+import gzip
+import json
+
+from fastapi.testclient import TestClient
+
+from main import accepts_gzip, app
+
+
+def test_accepts_gzip():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("*")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.5")
+    assert not accepts_gzip(None)
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("gzip;q=0")
+    assert accepts_gzip("*;q=0, gzip")
+    assert accepts_gzip("gzip; q=0.8; x=1")
+    assert not accepts_gzip("gzip;q=0, *")
+
+
+def test_analyze_stream_plain(repo, registry):
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/analyze/stream",
+            json={"local_path": str(repo)},
+            headers={"Accept-Encoding": "identity"},
+        )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    records = [json.loads(line) for line in response.content.splitlines()]
+    assert records[-1]["type"] == "summary"
+
+
+def test_analyze_stream_gzip_when_accepted(repo, registry):
+    with TestClient(app) as client:
+        with client.stream(
+            "POST",
+            "/api/analyze/stream",
+            json={"local_path": str(repo)},
+            headers={"Accept-Encoding": "gzip"},
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    records = [json.loads(line) for line in gzip.decompress(raw).splitlines()]
+    assert records[-1]["health_score"] == 85
+
+
+def test_analyze_stream_first_failure_is_500(repo, registry):
+    registry["https://registry.npmjs.org/react"] = {"dist-tags": {"latest": "next"}}
+
+    with TestClient(app) as client:
+        response = client.post("/api/analyze/stream", json={"local_path": str(repo)})
+
+    assert response.status_code == 500
+
+
+def test_services_created_on_first_use_without_lifespan(repo, registry):
+    app.state.analyzer = None
+    client = TestClient(app)
+
+    first = client.post("/api/analyze", json={"local_path": str(repo)})
+    analyzer = app.state.analyzer
+    client.post("/api/analyze", json={"local_path": str(repo)})
+
+    assert first.status_code == 200
+    assert first.json()["analysis_report"]["health_score"] == 85
+    assert analyzer is not None and app.state.analyzer is analyzer
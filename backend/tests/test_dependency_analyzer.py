@@ -0,0 +1,77 @@
+import itertools
+
+import pytest
+
+from modules.dependency_analyzer import DependencyAnalyzer
+
+
+# Output of the original (pre-streaming) analyze() for the fixture repo
+EXPECTED_REPORT = {
+    "summary": {"total_packages": 6, "outdated_count": 3},
+    "health_score": 85,
+    "outdated_packages": [
+        {"name": "react", "ecosystem": "npm", "current_version": "17.0.2",
+         "latest_version": "18.3.1", "severity": "major"},
+        {"name": "requests", "ecosystem": "pypi", "current_version": "2.25.0",
+         "latest_version": "2.32.3", "severity": "minor"},
+        {"name": "flask", "ecosystem": "pypi", "current_version": "2.3.1",
+         "latest_version": "2.3.3", "severity": "patch"},
+    ],
+    "partial": False,
+}
+
+
+def test_analyze_matches_original_report(repo, registry):
+    assert DependencyAnalyzer().analyze(str(repo)) == EXPECTED_REPORT
+
+
+def test_iter_analyze_yields_packages_then_summary(repo, registry):
+    records = list(DependencyAnalyzer().iter_analyze(str(repo)))
+
+    assert [r["type"] for r in records] == ["package"] * 6 + ["summary"]
+    assert records[-1]["health_score"] == EXPECTED_REPORT["health_score"]
+    assert records[-1]["summary"] == EXPECTED_REPORT["summary"]
+
+
+def test_iter_analyze_ends_with_error_record_on_failure(repo, registry):
+    # compare() indexes release[2], which "1.16" does not have
+    with open(repo / "requirements.txt", "a") as f:
+        f.write("six==1.16\n")
+    registry["https://pypi.org/pypi/six/json"] = {"info": {"version": "1.16.1"}}
+
+    records = list(DependencyAnalyzer().iter_analyze(str(repo)))
+
+    assert records[-1]["type"] == "error"
+    assert records[-1]["name"] == "six"
+    assert [r["type"] for r in records[:-1]] == ["package"] * 6
+
+
+def test_analyze_raises_on_failure(repo, registry):
+    registry["https://pypi.org/pypi/requests/json"] = {"info": {"version": "latest"}}
+
+    with pytest.raises(Exception, match="requests"):
+        DependencyAnalyzer().analyze(str(repo))
+
+
+def test_timeout_ignores_time_paused_at_yield(repo, registry, monkeypatch):
+    now = [0]
+    monkeypatch.setattr("modules.dependency_analyzer.time.time", lambda: now[0])
+
+    # Lookups are instant; the clock only moves while the reader is slow
+    results = []
+    for record in DependencyAnalyzer(timeout_seconds=5).iter_analyze(str(repo)):
+        results.append(record)
+        now[0] += 100
+
+    assert results[-1]["type"] == "summary"
+    assert results[-1]["partial"] is False
+
+
+def test_timeout_counts_lookup_time(repo, registry, monkeypatch):
+    clock = itertools.count(0, 10)
+    monkeypatch.setattr("modules.dependency_analyzer.time.time", lambda: next(clock))
+
+    records = list(DependencyAnalyzer(timeout_seconds=5).iter_analyze(str(repo)))
+
+    assert [r["type"] for r in records] == ["package", "summary"]
+    assert records[-1]["partial"] is True
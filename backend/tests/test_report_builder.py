@@ -0,0 +1,58 @@
+import gzip
+import itertools
+import json
+import zlib
+
+from modules.report_builder import ReportBuilder
+
+
+RECORDS = [
+    {"type": "package", "name": "react", "severity": "major"},
+    {"type": "package", "name": "lodash", "severity": "up-to-date"},
+    {"type": "summary", "health_score": 91},
+]
+
+
+def test_stream_ndjson_one_record_per_line():
+    lines = list(ReportBuilder.stream_ndjson(RECORDS))
+
+    assert [json.loads(line) for line in lines] == RECORDS
+    assert all(line.endswith(b"\n") for line in lines)
+
+
+def test_stream_gzip_round_trip():
+    compressed = b"".join(ReportBuilder.stream_gzip(ReportBuilder.stream_ndjson(RECORDS)))
+    lines = gzip.decompress(compressed).splitlines()
+
+    assert [json.loads(line) for line in lines] == RECORDS
+
+
+def test_stream_gzip_batches_small_records():
+    records = [{"type": "package", "name": f"pkg-{i}", "severity": "major"} for i in range(2000)]
+    raw = b"".join(ReportBuilder.stream_ndjson(records))
+
+    chunks = list(ReportBuilder.stream_gzip(ReportBuilder.stream_ndjson(records), flush_bytes=16 * 1024))
+
+    assert gzip.decompress(b"".join(chunks)) == raw
+    # One chunk per ~16 KB of input plus the final flush, not one per record
+    assert len(chunks) <= len(raw) // (16 * 1024) + 2
+    # Batching keeps the ratio close to compressing the whole body at once
+    assert len(b"".join(chunks)) <= len(gzip.compress(raw, ReportBuilder.GZIP_LEVEL)) * 1.1
+
+
+def test_stream_gzip_flushed_batches_decode_on_arrival():
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    lines = ReportBuilder.stream_ndjson(RECORDS)
+    stream = ReportBuilder.stream_gzip(lines, flush_bytes=1, flush_seconds=60)
+
+    for record in RECORDS:
+        assert json.loads(decoder.decompress(next(stream))) == record
+
+
+def test_stream_gzip_flushes_on_time(monkeypatch):
+    clock = itertools.count(0, 10)
+    monkeypatch.setattr("modules.report_builder.time.monotonic", lambda: next(clock))
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    stream = ReportBuilder.stream_gzip(ReportBuilder.stream_ndjson(RECORDS), flush_seconds=5)
+
+    assert json.loads(decoder.decompress(next(stream))) == RECORDS[0]
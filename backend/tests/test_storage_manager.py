@@ -0,0 +1,23 @@
+import shutil
+from pathlib import Path
+
+from modules.storage_manager import StorageManager
+
+
+def test_create_temp_directory(tmp_path):
+    storage = StorageManager(str(tmp_path))
+
+    path = Path(storage.create_temp_directory())
+
+    assert path.is_dir()
+    assert path.parent == storage.repos_dir
+
+
+def test_create_temp_directory_recreates_removed_base(tmp_path):
+    storage = StorageManager(str(tmp_path))
+    shutil.rmtree(storage.repos_dir)
+
+    path = Path(storage.create_temp_directory())
+
+    assert path.is_dir()
+    assert path.parent == storage.repos_dir